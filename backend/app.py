@@ -1,38 +1,188 @@
+import asyncio
+import atexit
 import base64
-import json
+import hashlib
+import itertools
 import os
+import queue
+import random
 import re
 import shutil
-import tempfile
-from typing import Dict, List, Optional, Tuple
-
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+try:
+    import fcntl
+except ImportError:  # Windows has no fcntl; the in-process lock still applies.
+    fcntl = None
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows.
+    uvloop = None
+
+import aiohttp
+import diskcache
+import httpx
+import lxml.html
+import orjson
+import pysbd
 import requests
-from bs4 import BeautifulSoup
-from flask import Flask, jsonify, request, current_app
+from flask import Flask, Response, jsonify, request, current_app, send_from_directory, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
 from flask_cors import CORS
-from openai import OpenAI
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
+from urllib3.util.retry import Retry
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    InternalServerError,
+    RateLimitError,
+)
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Serve and parse JSON with orjson; responses can carry megabytes of base64 audio."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=self.default), mimetype=self.mimetype)
+
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+# Only buffered JSON is compressed: MP3 bodies gain nothing, and streamed lessons must not be held back.
+app.config.update(
+    COMPRESS_MIMETYPES=["application/json"],
+    COMPRESS_ALGORITHM=["br", "gzip"],
+    COMPRESS_MIN_SIZE=1024,
+    COMPRESS_STREAMS=False,
+)
+Compress(app)
 CORS(app)
 
 SESSIONS_DIR = os.path.join(os.path.dirname(__file__), "sessions")
+SESSION_COUNTER_FILENAME = ".counter"
+SESSION_CHANGES_FILENAME = ".changes"
+PREVIEW_SOURCE_CHARS = 1024
+ARTICLE_MAX_BYTES = 5 * 1024 * 1024
 DOWNLOAD_VARIANTS = {
     "french-only",
     "french-english",
     "french-key-vocab",
     "french-english-key-vocab",
 }
+TRANSLATION_MODEL = "gpt-4o-mini"
+TTS_MODEL = "gpt-4o-mini-tts"
+TTS_VOICE = "alloy"
+MEMORY_CACHE_SIZE = 256
+TRANSLATION_ATTEMPTS = 2
+TTS_CONCURRENCY = max(1, int(os.getenv("TTS_CONCURRENCY", "20")))
+TTS_CACHE_ENABLED = os.getenv("TTS_CACHE_ENABLED", "1") != "0"
+TTS_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+OPENAI_MAX_ATTEMPTS = 4
+OPENAI_TIMEOUT_SECONDS = 120
+OPENAI_MAX_RETRY_DELAY_SECONDS = 60
+RETRYABLE_OPENAI_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+
+# Kept byte-identical across requests, and ahead of the passage, so OpenAI's prompt cache can reuse the prefix.
+TRANSLATION_SYSTEM_PROMPT = (
+    "You translate French into English and respond using JSON only for a web application.\n"
+    "Each input_text item in the user message is one French sentence, prefixed with its index and a colon. "
+    "Translate every item into English, returning exactly one entry per item in the same order with its index "
+    "copied into the index field. Never merge or split items. Return JSON matching the response schema.\n\n"
+    "For each sentence include a key_vocab list with 2-5 important, non-obvious French words or short phrases "
+    "that could confuse a learner. Provide the original French and a concise English gloss, "
+    "focusing on challenging or idiomatic terms while avoiding obvious words."
+)
+
+# Strict structured output: the model can only emit JSON that matches this schema.
+TRANSLATION_FORMAT = {
+    "type": "json_schema",
+    "name": "sentence_translations",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "sentences": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "index": {"type": "integer"},
+                        "english": {"type": "string"},
+                        "key_vocab": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "french": {"type": "string"},
+                                    "english": {"type": "string"},
+                                },
+                                "required": ["french", "english"],
+                                "additionalProperties": False,
+                            },
+                        },
+                    },
+                    "required": ["index", "english", "key_vocab"],
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "required": ["sentences"],
+        "additionalProperties": False,
+    },
+}
 
+# Bump when sentence splitting changes; prompt and schema edits change the key on their own.
+TRANSLATION_CACHE_VERSION = "3"
 
-def _get_openai_client() -> OpenAI:
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise RuntimeError("OPENAI_API_KEY environment variable is not set.")
-    return OpenAI(api_key=api_key)
+T = TypeVar("T")
 
+_TRANSLATION_CONTRACT = TRANSLATION_SYSTEM_PROMPT + orjson.dumps(
+    TRANSLATION_FORMAT, option=orjson.OPT_SORT_KEYS
+).decode("utf-8")
 
-def _extract_text_from_url(url: str) -> str:
-    headers = {
+_WHITESPACE_RE = re.compile(r"\s+")
+_SEGMENT_AUDIO_RE = re.compile(r"segment_\d+(?:_kv_\d+)?_(?:fr|en)\.mp3")
+_sentence_segmenter = pysbd.Segmenter(language="fr", clean=False)
+
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+_event_loop_lock = threading.Lock()
+_tts_semaphore: Optional[asyncio.Semaphore] = None
+_tts_in_flight: Dict[str, "asyncio.Future[bytes]"] = {}
+_tts_waiters: Dict["asyncio.Future[bytes]", int] = {}
+_tts_http_session: Optional[aiohttp.ClientSession] = None
+_openai_client: Optional[AsyncOpenAI] = None
+_openai_client_lock = threading.Lock()
+
+# Translations and synthesized audio are cached on disk, with a small in-memory
+# LRU in front. Both are only touched from the OpenAI loop thread.
+_disk_cache: Optional[diskcache.Cache] = None
+_memory_cache: "OrderedDict[str, object]" = OrderedDict()
+
+_session_id_lock = threading.Lock()
+_file_io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="session-io")
+_session_list_cache: Optional[Tuple[Tuple[int, int], List[Dict[str, object]]]] = None
+
+# Shared session so repeated article fetches reuse pooled keep-alive connections.
+_http = requests.Session()
+_http.headers.update(
+    {
         "User-Agent": (
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
             "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -42,174 +192,558 @@ def _extract_text_from_url(url: str) -> str:
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         "Referer": "https://www.google.com/",
     }
-    response = requests.get(url, headers=headers, timeout=20)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
-    paragraphs = [p.get_text(strip=True) for p in soup.find_all("p")]
-    text = "\n".join(filter(None, paragraphs))
-    return text.strip()
+)
+_http_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+)
+_http.mount("https://", _http_adapter)
+_http.mount("http://", _http_adapter)
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    # OpenAI calls run on one long-lived loop so request threads can share it.
+    global _event_loop
+    with _event_loop_lock:
+        if _event_loop is None:
+            loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="openai-event-loop", daemon=True).start()
+            _event_loop = loop
+    return _event_loop
+
 
+def _run_async(coroutine: Awaitable[T]) -> T:
+    return asyncio.run_coroutine_threadsafe(coroutine, _get_event_loop()).result()
 
-def extract_dict(text):
-    # Find the first { and last }
-    start = text.find('{')
-    end = text.rfind('}')
-    if start == -1 or end == -1 or start >= end:
-        raise ValueError("No valid dictionary found in text")
 
-    # Extract substring
-    dict_str = text[start:end+1]
+def _get_tts_semaphore() -> asyncio.Semaphore:
+    # Created lazily so the semaphore belongs to the running OpenAI loop.
+    global _tts_semaphore
+    if _tts_semaphore is None:
+        _tts_semaphore = asyncio.Semaphore(TTS_CONCURRENCY)
+    return _tts_semaphore
 
-    # Optional: clean up trailing characters or invalid JSON symbols
-    dict_str = re.sub(r'(?s)^.*?({.*})$', r'\1', dict_str.strip())
 
-    # Parse into Python dict
+def _get_disk_cache() -> diskcache.Cache:
+    # Opened on first use so importing the module does not create the sessions directory.
+    global _disk_cache
+    if _disk_cache is None:
+        _disk_cache = diskcache.Cache(os.path.join(SESSIONS_DIR, ".cache"))
+    return _disk_cache
+
+
+def _cache_key(*parts: str) -> str:
+    return hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _remember(key: str, value: object) -> None:
+    _memory_cache[key] = value
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
+def _cache_get(key: str) -> Optional[object]:
+    if key in _memory_cache:
+        _memory_cache.move_to_end(key)
+        return _memory_cache[key]
+    value = _get_disk_cache().get(key)
+    if value is not None:
+        _remember(key, value)
+    return value
+
+
+def _cache_set(key: str, value: object, expire: Optional[float] = None) -> None:
+    _get_disk_cache().set(key, value, expire=expire)
+    _remember(key, value)
+
+
+async def _gather_or_cancel(coroutines: List[Awaitable[T]]) -> List[T]:
+    # asyncio.gather leaves sibling tasks running when one fails; stop them so a
+    # failed lesson does not keep spending rate limit on audio nobody will receive.
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
     try:
-        data = json.loads(dict_str)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Extracted text is not valid JSON: {e}")
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+def _get_tts_http_session() -> aiohttp.ClientSession:
+    # TTS bypasses the SDK and posts straight to the speech endpoint over a pooled session.
+    global _tts_http_session
+    if _tts_http_session is None or _tts_http_session.closed:
+        _tts_http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=OPENAI_TIMEOUT_SECONDS, connect=10),
+        )
+    return _tts_http_session
 
-    return data
 
-def _extract_response_text(response) -> str:
-    if hasattr(response, "output_text"):
-        output_text = getattr(response, "output_text")
-        if isinstance(output_text, str):
-            return output_text.strip()
-
-    pieces: List[str] = []
-    for block in getattr(response, "output", []):
-        for item in getattr(block, "content", []):
-            text = getattr(item, "text", None)
-            if isinstance(text, str):
-                pieces.append(text)
-    if not pieces and hasattr(response, "content") and isinstance(response.content, list):
-        for item in response.content:
-            if isinstance(item, dict) and "text" in item and isinstance(item["text"], str):
-                pieces.append(item["text"])
+def _is_retryable_error(error: Exception) -> bool:
+    if isinstance(error, RETRYABLE_OPENAI_ERRORS):
+        return True
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
 
 
-    return "\n".join(pieces).strip()
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    # aiohttp errors carry the headers directly; OpenAI SDK errors carry the httpx response.
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            return max(0.0, float(retry_after_ms) / 1000)
+        retry_after = headers.get("retry-after")
+        if retry_after is not None:
+            return max(0.0, float(retry_after))
+    except ValueError:  # HTTP-date values fall back to exponential backoff.
+        pass
+    return None
+
+
+async def _with_retries(make_call: Callable[[], Awaitable[T]]) -> T:
+    for attempt in range(OPENAI_MAX_ATTEMPTS):
+        try:
+            return await make_call()
+        except Exception as error:  # noqa: BLE001
+            if not _is_retryable_error(error) or attempt == OPENAI_MAX_ATTEMPTS - 1:
+                raise
+            retry_after = _retry_after_seconds(error)
+            if retry_after is not None:
+                delay = min(retry_after, OPENAI_MAX_RETRY_DELAY_SECONDS)
+            else:
+                delay = 2 ** attempt + random.random()
+            app.logger.warning("OpenAI call failed (%s), retrying in %.1fs", error, delay)
+            await asyncio.sleep(delay)
+    raise RuntimeError("OpenAI call did not complete")
+
+
+def _get_openai_client() -> AsyncOpenAI:
+    # One shared client keeps its connection pool warm across requests.
+    global _openai_client
+    with _openai_client_lock:
+        if _openai_client is None:
+            api_key = os.getenv("OPENAI_API_KEY")
+            if not api_key:
+                raise RuntimeError("OPENAI_API_KEY environment variable is not set.")
+            # Retries are handled per call by _with_retries, so the SDK's own are disabled.
+            _openai_client = AsyncOpenAI(
+                api_key=api_key,
+                max_retries=0,
+                timeout=httpx.Timeout(OPENAI_TIMEOUT_SECONDS, connect=10.0),
+                # HTTP/2 multiplexes concurrent requests over a few long-lived connections.
+                http_client=DefaultAsyncHttpxClient(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                ),
+            )
+    return _openai_client
 
 
-def _split_and_translate_sentences(client: OpenAI, sentences: List[str]) -> List[str]:
-    if not sentences:
-        return []
+async def _close_http_clients() -> None:
+    if _openai_client is not None:
+        await _openai_client.close()
+    if _tts_http_session is not None and not _tts_http_session.closed:
+        await _tts_http_session.close()
 
-    schema = """
-    {
-        raw_text: sentences in french,
-        sentences: [
-            {
-                "english": English translation of sentence 0,
-                "french": French translation of sentence 0,
-                "key_vocab": [
-                    {"french": "key french word", "english": "english meaning"},
-                    ...
-                ]
-            },
-            ...
-        ]
-    }
-    """
 
-    prompt = {
-        "role": "system",
-        "content": (
-            f"Translate each of the following French sentences into English. "
-            f"Return a JSON object using the following format {schema}\n\n"
-            f"For each sentence include a key_vocab list with 2-5 important, non-obvious French words or short phrases "
-            f"that could confuse a learner. Provide the original French and a concise English gloss.\n\n"
-            f"Sentences: {json.dumps(sentences, ensure_ascii=False)}"
-        ),
-    }
+@atexit.register
+def _shutdown_http_clients() -> None:
+    if _event_loop is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_close_http_clients(), _event_loop).result(timeout=5)
+    except Exception:  # noqa: BLE001
+        pass
+
+
+def _read_article_body(url: str) -> Tuple[bytes, Optional[str]]:
+    """Return the page body and the charset declared in its ``Content-Type`` header, if any."""
+    # Stream the page so non-HTML or oversized responses are rejected before they are buffered.
+    with _http.get(url, timeout=20, stream=True) as response:
+        response.raise_for_status()
+        content_type = response.headers.get("Content-Type", "").lower()
+        if content_type and "html" not in content_type:
+            raise ValueError("The URL does not point to an HTML page.")
+        content_length = response.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > ARTICLE_MAX_BYTES:
+            raise ValueError("The article page is too large to import.")
+
+        chunks: List[bytes] = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            size += len(chunk)
+            if size > ARTICLE_MAX_BYTES:
+                raise ValueError("The article page is too large to import.")
+            chunks.append(chunk)
+        # requests assumes ISO-8859-1 for any text/* response, so only trust an explicit charset.
+        encoding = response.encoding if "charset=" in content_type else None
+    return b"".join(chunks), encoding
+
 
-    message_context = (
-        f"You translate French into English and respond using JSON only for a web application.\n"
-        f"Use the format {schema} and ensure key_vocab items focus on challenging or idiomatic terms while avoiding obvious words."
+def _extract_text_from_url(url: str) -> str:
+    content, encoding = _read_article_body(url)
+    if not content.strip():
+        return ""
+    encoding = encoding or chardet.detect(content)["encoding"] or "utf-8"
+    try:
+        text = content.decode(encoding, errors="replace")
+    except LookupError:
+        text = content.decode("utf-8", errors="replace")
+    # Re-encoded as UTF-8 with the parser told so: lxml would otherwise read a page without a
+    # <meta charset> as latin-1, and refuses str input that carries an XML encoding declaration.
+    try:
+        tree = lxml.html.fromstring(text.encode("utf-8"), parser=lxml.html.HTMLParser(encoding="utf-8"))
+    except (etree.ParserError, ValueError):
+        return ""
+    # Each paragraph's text is gathered in one pass and is already stripped, so no second filter is needed.
+    return "\n".join(
+        text for paragraph in tree.iter("p") if (text := paragraph.text_content().strip())
     )
-    current_app.logger.info("OpenAI system prompt: %s", message_context) 
-    current_app.logger.info("OpenAI prompt: %s", prompt) 
-    response = client.responses.create(
-        model="gpt-4o-mini",
-        input=[
-            {
-                "role": "system",
-                "content": message_context,
-            },
-            prompt,
-        ]
+
+
+def _extract_response_text(response) -> str:
+    # SDK responses carry the aggregated text already; only walk the blocks when it is missing.
+    output_text = getattr(response, "output_text", None)
+    if isinstance(output_text, str) and output_text:
+        return output_text.strip()
+
+    pieces = [
+        item.text
+        for block in getattr(response, "output", None) or ()
+        for item in getattr(block, "content", None) or ()
+        if isinstance(getattr(item, "text", None), str)
+    ]
+    content = getattr(response, "content", None)
+    if not pieces and isinstance(content, list):
+        pieces = [item["text"] for item in content if isinstance(item, dict) and isinstance(item.get("text"), str)]
+    return "\n".join(pieces).strip()
+
+
+def _normalize_passage(text: str) -> str:
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _translation_cache_key(sentences: List[str]) -> str:
+    # Keyed on the split rather than the raw text, so texts only cache together when they split the same way.
+    return _cache_key(
+        "translation", TRANSLATION_CACHE_VERSION, TRANSLATION_MODEL, _TRANSLATION_CONTRACT, "\n".join(sentences)
     )
 
-    content = _extract_response_text(response)
-    current_app.logger.info("OpenAI response: %s", content) 
-    content = extract_dict(content)
-    current_app.logger.info("OpenAI response post cleaning: %s", content) 
-    if not content:
-        raise RuntimeError("Unexpected response format from translation request")
 
-    if "sentences" in content:
-        items = content["sentences"]
-    else:
-        raise RuntimeError("Unable to extract items from JSON")
-    current_app.logger.info("items: %s", items) 
+def _split_sentences(text: str) -> List[str]:
+    # Each line is segmented on its own so unpunctuated headings, bylines and captions are not glued
+    # onto the next sentence. pysbd keeps per-call state on the segmenter, which is safe because
+    # translation only runs on the loop thread.
+    sentences: List[str] = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        for sentence in _sentence_segmenter.segment(line):
+            sentence = _normalize_passage(sentence)
+            if sentence:
+                sentences.append(sentence)
+    return sentences
+
+
+def _translation_input(sentences: List[str], start: int = 0) -> List[Dict[str, object]]:
+    # Each sentence goes in as its own numbered input_text item; the model echoes the number back so
+    # a merged or split sentence is caught instead of shifting every later translation.
+    return [
+        {
+            "role": "system",
+            "content": TRANSLATION_SYSTEM_PROMPT,
+        },
+        {
+            "role": "user",
+            "content": [
+                {"type": "input_text", "text": f"{index}: {sentences[index]}"}
+                for index in range(start, len(sentences))
+            ],
+        },
+    ]
+
+
+def _translated_pair(sentences: List[str], index: int, item: object) -> Dict[str, object]:
+    """Attach the French sentence to the ``index``-th translation; ``ValueError`` when they do not line up."""
+    if index >= len(sentences):
+        raise ValueError(f"got more than the {len(sentences)} sentences sent")
+    if not isinstance(item, dict) or item.get("index") != index:
+        raise ValueError(f"translation {index} does not belong to sentence {index}")
+    return {"french": sentences[index], "english": item.get("english"), "key_vocab": item.get("key_vocab")}
+
+
+def _parse_translation(sentences: List[str], response_text: str) -> List[Dict[str, object]]:
+    # orjson.JSONDecodeError is a ValueError, so every unusable response surfaces the same way.
+    content = orjson.loads(response_text)
+    if not isinstance(content, dict) or not isinstance(content.get("sentences"), list):
+        raise ValueError("no sentences list in the response")
+    items = [_translated_pair(sentences, index, item) for index, item in enumerate(content["sentences"])]
+    if len(items) != len(sentences):
+        raise ValueError(f"got {len(items)} translations for {len(sentences)} sentences")
     return items
 
 
-def _response_to_base64_audio(response_obj) -> str:
-    audio_bytes: Optional[bytes] = None
-
-    if hasattr(response_obj, "read") and callable(response_obj.read):  # streaming responses
-        audio_bytes = response_obj.read()
-    elif hasattr(response_obj, "to_bytes") and callable(response_obj.to_bytes):
-        audio_bytes = response_obj.to_bytes()
-    elif hasattr(response_obj, "content"):
-        content = response_obj.content
-        if isinstance(content, (bytes, bytearray)):
-            audio_bytes = bytes(content)
-        elif isinstance(content, list):
-            # Some SDK versions expose a list of audio chunks.
-            collected = bytearray()
-            for chunk in content:
-                if isinstance(chunk, (bytes, bytearray)):
-                    collected.extend(chunk)
-                elif isinstance(chunk, dict) and "audio" in chunk:
-                    value = chunk["audio"]
-                    if isinstance(value, str):
-                        try:
-                            collected.extend(base64.b64decode(value))
-                        except Exception:  # noqa: BLE001
-                            continue
-                    elif isinstance(value, (bytes, bytearray)):
-                        collected.extend(value)
-            if collected:
-                audio_bytes = bytes(collected)
-    elif isinstance(response_obj, (bytes, bytearray)):
-        audio_bytes = bytes(response_obj)
-
-    if audio_bytes is None:
-        # Fall back to streaming into a temporary file when available.
-        if hasattr(response_obj, "stream_to_file") and callable(response_obj.stream_to_file):
-            with tempfile.NamedTemporaryFile(suffix=".mp3") as temp_file:
-                response_obj.stream_to_file(temp_file.name)  # type: ignore[arg-type]
-                temp_file.seek(0)
-                audio_bytes = temp_file.read()
+async def _split_and_translate_sentences(client: AsyncOpenAI, text: str) -> List[Dict[str, object]]:
+    """Split ``text`` into sentences and translate them in a single structured model call."""
+    sentences = _split_sentences(text)
+    if not sentences:
+        return []
 
-    if not audio_bytes:
-        raise RuntimeError("Unable to extract audio data from OpenAI response")
+    cache_key = _translation_cache_key(sentences)
+    cached_items = _cache_get(cache_key)
+    if cached_items is not None:
+        app.logger.debug("Using cached translation")
+        return cached_items
+
+    # Prompts and responses can run to tens of kilobytes; log a truncated copy at debug level only.
+    app.logger.debug("OpenAI prompt: %.500s", "\n".join(sentences))
+    for attempt in range(TRANSLATION_ATTEMPTS):
+        response = await _with_retries(
+            lambda: client.responses.create(
+                model=TRANSLATION_MODEL,
+                input=_translation_input(sentences),
+                text={"format": TRANSLATION_FORMAT},
+            )
+        )
 
-    return base64.b64encode(audio_bytes).decode("utf-8")
+        response_text = _extract_response_text(response)
+        app.logger.debug("OpenAI response: %.500s", response_text)
+        try:
+            items = _parse_translation(sentences, response_text)
+            break
+        except ValueError as error:
+            if attempt == TRANSLATION_ATTEMPTS - 1:
+                raise RuntimeError(f"Translation response is unusable: {error}") from error
+            app.logger.warning("Translation response is unusable (%s), requesting it again", error)
+
+    app.logger.debug("Translated %d sentences", len(items))
+    if items:
+        _cache_set(cache_key, items)
+    return items
 
 
-def _synthesize_audio(client: OpenAI, text: str, language: str) -> str:
-    speech_response = client.audio.speech.create(
-        model="gpt-4o-mini-tts",
-        voice="alloy",
-        speed=1,
-        input=text,
-        instructions="Input is in " + language
+class _SentenceStreamParser:
+    """Pull each ``sentences[i]`` object out of streamed translation JSON as soon as it closes."""
+
+    # Depth of a sentence object: top-level object -> "sentences" array -> sentence object.
+    SENTENCE_DEPTH = 3
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.finished = False
+        self._position = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._sentence_start = 0
+
+    def feed(self, delta: str) -> List[Dict[str, object]]:
+        self.text += delta
+        sentences: List[Dict[str, object]] = []
+        for position in range(self._position, len(self.text)):
+            char = self.text[position]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == self.SENTENCE_DEPTH and char == "{":
+                    self._sentence_start = position
+            elif char in "}]":
+                if self._depth == self.SENTENCE_DEPTH and char == "}":
+                    sentences.append(orjson.loads(self.text[self._sentence_start : position + 1]))
+                self._depth -= 1
+                if self._depth == 0:
+                    self.finished = True
+        self._position = len(self.text)
+        return sentences
+
+
+async def _stream_translation_attempt(
+    client: AsyncOpenAI, sentences: List[str], start: int
+) -> AsyncIterator[Dict[str, object]]:
+    """Stream translations of ``sentences[start:]``; ``ValueError`` when the output cannot be used."""
+    stream = await _with_retries(
+        lambda: client.responses.create(
+            model=TRANSLATION_MODEL,
+            input=_translation_input(sentences, start),
+            text={"format": TRANSLATION_FORMAT},
+            stream=True,
+        )
     )
-    return _response_to_base64_audio(speech_response)
+    parser = _SentenceStreamParser()
+    index = start
+    # Each pair is held back until the next one lines up: a merged sentence still carries its own
+    # index, and only shows up as wrong once the following translation is off by one.
+    held: Optional[Dict[str, object]] = None
+    async with stream:
+        async for event in stream:
+            if event.type == "response.output_text.delta":
+                for item in parser.feed(event.delta):
+                    pair = _translated_pair(sentences, index, item)
+                    index += 1
+                    if held is not None:
+                        yield held
+                    held = pair
+            elif event.type == "response.incomplete":
+                raise ValueError("the response was cut off")
+            elif event.type in ("response.failed", "error"):
+                raise RuntimeError("Translation request did not complete")
+
+    app.logger.debug("OpenAI response: %.500s", parser.text)
+    if not parser.finished:
+        raise ValueError("the response ended before the JSON was complete")
+    if index != len(sentences):
+        raise ValueError(f"got {index - start} translations for {len(sentences) - start} sentences")
+    if held is not None:
+        yield held
+
+
+async def _stream_translated_sentences(client: AsyncOpenAI, text: str) -> AsyncIterator[Dict[str, object]]:
+    """Yield translated sentence pairs one by one while the model is still generating the rest.
+
+    Pairs are only yielded once the next translation confirms them, so when a response turns out
+    unusable part-way through, only the sentences not yet yielded are requested again. A result
+    stitched together from more than one response is not cached.
+    """
+    sentences = _split_sentences(text)
+    if not sentences:
+        return
+
+    cache_key = _translation_cache_key(sentences)
+    cached_items = _cache_get(cache_key)
+    if cached_items is not None:
+        app.logger.debug("Using cached translation")
+        for item in cached_items:
+            yield item
+        return
+
+    app.logger.debug("OpenAI prompt: %.500s", "\n".join(sentences))
+    items: List[Dict[str, object]] = []
+    stitched = False
+    for attempt in range(TRANSLATION_ATTEMPTS):
+        try:
+            async for pair in _stream_translation_attempt(client, sentences, len(items)):
+                items.append(pair)
+                yield pair
+            break
+        except ValueError as error:
+            if attempt == TRANSLATION_ATTEMPTS - 1:
+                raise RuntimeError(f"Translation response is unusable: {error}") from error
+            stitched = stitched or bool(items)
+            app.logger.warning(
+                "Translation response is unusable (%s), requesting the remaining %d sentences again",
+                error,
+                len(sentences) - len(items),
+            )
+
+    app.logger.debug("Translated %d sentences", len(items))
+    if not stitched:
+        _cache_set(cache_key, items)
+
+
+def _speech_headers(client: AsyncOpenAI) -> Dict[str, str]:
+    # Mirror the SDK's auth, organization and project headers so TTS is billed and routed like translation.
+    headers = {"Authorization": f"Bearer {client.api_key}"}
+    if client.organization:
+        headers["OpenAI-Organization"] = client.organization
+    if client.project:
+        headers["OpenAI-Project"] = client.project
+    return headers
+
+
+async def _request_speech(client: AsyncOpenAI, text: str, language: str) -> bytes:
+    # Built from the client's base URL so OPENAI_BASE_URL proxies receive TTS as well.
+    async with _get_tts_http_session().post(
+        str(client.base_url.join("audio/speech")),
+        headers=_speech_headers(client),
+        json={
+            "model": TTS_MODEL,
+            "voice": TTS_VOICE,
+            "speed": 1,
+            "input": text,
+            "instructions": "Input is in " + language,
+        },
+    ) as response:
+        response.raise_for_status()
+        return await response.read()
+
+
+async def _fetch_speech(client: AsyncOpenAI, text: str, language: str, cache_key: str) -> bytes:
+    async with _get_tts_semaphore():
+        audio_bytes = await _with_retries(lambda: _request_speech(client, text, language))
+    if not audio_bytes:
+        raise RuntimeError("OpenAI returned no audio data")
+    if TTS_CACHE_ENABLED:
+        _cache_set(cache_key, audio_bytes, expire=TTS_CACHE_TTL_SECONDS)
+    return audio_bytes
+
+
+async def _synthesize_audio(client: AsyncOpenAI, text: str, language: str) -> bytes:
+    cache_key = _cache_key("tts", TTS_MODEL, TTS_VOICE, language, text)
+    audio_bytes = _cache_get(cache_key) if TTS_CACHE_ENABLED else None
+    if audio_bytes is not None:
+        return audio_bytes
+
+    # A clip repeated within a lesson (or requested by two lessons at once) is synthesized once;
+    # later callers wait on the request already in flight.
+    pending = _tts_in_flight.get(cache_key)
+    if pending is None:
+        pending = asyncio.ensure_future(_fetch_speech(client, text, language, cache_key))
+        _tts_in_flight[cache_key] = pending
+        _tts_waiters[pending] = 0
+        pending.add_done_callback(lambda done: _forget_tts_request(cache_key, done))
+    _tts_waiters[pending] += 1
+    try:
+        # Shielded so one caller being cancelled does not fail the others sharing the request.
+        return await asyncio.shield(pending)
+    except asyncio.CancelledError:
+        # The last caller to give up cancels the request itself, so abandoned lessons stop holding
+        # the TTS semaphore and spending quota.
+        if _tts_waiters.get(pending) == 1:
+            _forget_tts_request(cache_key, pending)
+            pending.cancel()
+        raise
+    finally:
+        if pending in _tts_waiters:
+            _tts_waiters[pending] -= 1
+
+
+def _forget_tts_request(cache_key: str, pending: "asyncio.Future[bytes]") -> None:
+    if _tts_in_flight.get(cache_key) is pending:
+        del _tts_in_flight[cache_key]
+    _tts_waiters.pop(pending, None)
+
+
+def _encode_audio(audio_bytes: Optional[bytes]) -> Optional[str]:
+    if not audio_bytes:
+        return None
+    return base64.b64encode(audio_bytes).decode("utf-8")
+
+
+def _read_manifest(manifest_path: str) -> Dict[str, object]:
+    with open(manifest_path, "rb") as manifest_file:
+        return orjson.loads(manifest_file.read())
+
+
+def _write_manifest(manifest_path: str, manifest: Dict[str, object]) -> None:
+    with open(manifest_path, "wb") as manifest_file:
+        manifest_file.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
 
 
 def _ensure_sessions_dir() -> str:
@@ -217,16 +751,62 @@ def _ensure_sessions_dir() -> str:
     return SESSIONS_DIR
 
 
+def _max_session_id(sessions_dir: str) -> int:
+    with os.scandir(sessions_dir) as entries:
+        return max((int(entry.name) for entry in entries if entry.name.isdigit()), default=0)
+
+
+def _next_session_id(sessions_dir: str) -> int:
+    # The last issued id lives in a counter file so saving does not rescan every session.
+    counter_path = os.path.join(sessions_dir, SESSION_COUNTER_FILENAME)
+    with _session_id_lock, open(counter_path, "a+", encoding="utf-8") as counter_file:
+        if fcntl is not None:
+            fcntl.flock(counter_file, fcntl.LOCK_EX)
+        counter_file.seek(0)
+        stored_id = counter_file.read().strip()
+        last_id = int(stored_id) if stored_id.isdigit() else _max_session_id(sessions_dir)
+        next_id = last_id + 1
+        counter_file.seek(0)
+        counter_file.truncate()
+        counter_file.write(str(next_id))
+    return next_id
+
+
 def _create_session_directory() -> Tuple[str, int]:
     sessions_dir = _ensure_sessions_dir()
-    existing_ids: List[int] = []
-    for name in os.listdir(sessions_dir):
-        if name.isdigit():
-            existing_ids.append(int(name))
-    next_id = max(existing_ids, default=0) + 1
-    session_dir = os.path.join(sessions_dir, str(next_id))
-    os.makedirs(session_dir, exist_ok=True)
-    return session_dir, next_id
+    while True:
+        next_id = _next_session_id(sessions_dir)
+        session_dir = os.path.join(sessions_dir, str(next_id))
+        try:
+            os.mkdir(session_dir)
+        except FileExistsError:
+            # The counter fell behind an existing session; take the next id rather than merge into it.
+            continue
+        return session_dir, next_id
+
+
+def _session_changes_path(sessions_dir: str) -> str:
+    return os.path.join(sessions_dir, SESSION_CHANGES_FILENAME)
+
+
+def _invalidate_session_list() -> None:
+    global _session_list_cache
+    _session_list_cache = None
+    # Stamp the shared marker file so every worker process drops its cached listing, including for
+    # changes such as a rename that leave the sessions directory's own mtime untouched.
+    changes_path = _session_changes_path(_ensure_sessions_dir())
+    with open(changes_path, "a", encoding="utf-8"):
+        pass
+    stamp = time.time_ns()
+    os.utime(changes_path, ns=(stamp, stamp))
+
+
+def _session_list_version(sessions_dir: str) -> Tuple[int, int]:
+    try:
+        changes_mtime = os.stat(_session_changes_path(sessions_dir)).st_mtime_ns
+    except FileNotFoundError:
+        changes_mtime = 0
+    return os.stat(sessions_dir).st_mtime_ns, changes_mtime
 
 
 def _write_audio_file(session_dir: str, filename: str, audio_base64: Optional[str]) -> Optional[str]:
@@ -235,7 +815,7 @@ def _write_audio_file(session_dir: str, filename: str, audio_base64: Optional[st
     try:
         audio_bytes = base64.b64decode(audio_base64)
     except Exception as error:  # noqa: BLE001
-        current_app.logger.error("Failed to decode audio for %s: %s", filename, error)
+        app.logger.error("Failed to decode audio for %s: %s", filename, error)
         return None
     file_path = os.path.join(session_dir, filename)
     with open(file_path, "wb") as audio_file:
@@ -243,14 +823,16 @@ def _write_audio_file(session_dir: str, filename: str, audio_base64: Optional[st
     return filename
 
 
-def _read_audio_file_as_base64(session_dir: str, filename: Optional[str]) -> Optional[str]:
+def _session_audio_path(session_dir: str, filename: Optional[str]) -> Optional[str]:
     if not filename:
         return None
-    file_path = os.path.join(session_dir, filename)
-    if not os.path.exists(file_path):
+    return os.path.join(session_dir, filename)
+
+
+def _session_audio_url(session_id: int, filename: Optional[str]) -> Optional[str]:
+    if not filename:
         return None
-    with open(file_path, "rb") as audio_file:
-        return base64.b64encode(audio_file.read()).decode("utf-8")
+    return f"/api/sessions/{session_id}/audio/{filename}"
 
 
 def _decode_audio_bytes(audio_value: Optional[str]) -> Optional[bytes]:
@@ -281,50 +863,142 @@ def _get_audio_value(item: Dict[str, object], snake_key: str) -> Optional[str]:
     return item.get(camel_key)
 
 
-def _build_segments(client: OpenAI, text: str) -> List[Dict[str, str]]:
-    sentence_pairs = _split_and_translate_sentences(client, text)
+def _normalize_key_vocab(raw_key_vocab: object) -> List[Dict[str, str]]:
+    key_vocab: List[Dict[str, str]] = []
+    if not isinstance(raw_key_vocab, list):
+        return key_vocab
+    for vocab in raw_key_vocab:
+        if not isinstance(vocab, dict):
+            continue
+        vocab_fr = (vocab.get("french") or "").strip()
+        vocab_en = (vocab.get("english") or "").strip()
+        if vocab_fr and vocab_en:
+            key_vocab.append({"french": vocab_fr, "english": vocab_en})
+    return key_vocab
+
 
-    current_app.logger.info("build segments starting...")
-    segments: List[Dict[str, str]] = []
+def _normalize_pair(pair: Dict[str, object], index: int) -> Optional[Dict[str, object]]:
+    """Strip a translated sentence pair; ``None`` when either side is empty."""
+    french = (pair.get("french") or "").strip()
+    english = (pair.get("english") or "").strip()
+    if not french or not english:
+        return None
+    return {
+        "id": index,
+        "french": french,
+        "english": english,
+        "key_vocab": _normalize_key_vocab(pair.get("key_vocab")),
+    }
+
+
+def _prepare_pairs(sentence_pairs: List[Dict[str, object]]) -> List[Dict[str, object]]:
+    prepared_pairs: List[Dict[str, object]] = []
     for index, pair in enumerate(sentence_pairs):
-        french = (pair.get("french") or "").strip()
-        english = (pair.get("english") or "").strip()
-        if not french or not english:
-            current_app.logger.info("Skipping :", pair)
+        prepared_pair = _normalize_pair(pair, index)
+        if prepared_pair is None:
+            app.logger.debug("Skipping: %s", pair)
             continue
-        french_audio = _synthesize_audio(client, french, 'french')
-        english_audio = _synthesize_audio(client, english, 'english')
-        key_vocab_audio: List[Dict[str, str]] = []
-        raw_key_vocab = pair.get("key_vocab")
-        if isinstance(raw_key_vocab, list):
-            for vocab_index, vocab in enumerate(raw_key_vocab):
-                vocab_fr = (vocab.get("french") or "").strip()
-                vocab_en = (vocab.get("english") or "").strip()
-                if not vocab_fr or not vocab_en:
-                    continue
-                vocab_fr_audio = _synthesize_audio(client, vocab_fr, 'french')
-                vocab_en_audio = _synthesize_audio(client, vocab_en, 'english')
-                key_vocab_audio.append(
-                    {
-                        "id": f"{index}-{vocab_index}",
-                        "french": vocab_fr,
-                        "english": vocab_en,
-                        "audio_fr": vocab_fr_audio,
-                        "audio_en": vocab_en_audio,
-                    }
-                )
-        segments.append(
+        prepared_pairs.append(prepared_pair)
+    return prepared_pairs
+
+
+async def _synthesize_segment(client: AsyncOpenAI, pair: Dict[str, object]) -> Dict[str, object]:
+    """Synthesize every clip of one prepared pair; audio fields hold raw MP3 bytes."""
+    speech_requests: List[Tuple[str, str]] = [(pair["french"], "french"), (pair["english"], "english")]
+    for vocab in pair["key_vocab"]:
+        speech_requests.append((vocab["french"], "french"))
+        speech_requests.append((vocab["english"], "english"))
+
+    audio_results = iter(
+        await _gather_or_cancel(
+            [_synthesize_audio(client, speech_text, language) for speech_text, language in speech_requests]
+        )
+    )
+
+    french_audio = next(audio_results)
+    english_audio = next(audio_results)
+    key_vocab_audio: List[Dict[str, object]] = []
+    for vocab_index, vocab in enumerate(pair["key_vocab"]):
+        key_vocab_audio.append(
             {
-                "id": index,
-                "french": french,
-                "english": english,
-                "audio_fr": french_audio,
-                "audio_en": english_audio,
-                "key_vocab": key_vocab_audio,
+                "id": f"{pair['id']}-{vocab_index}",
+                "french": vocab["french"],
+                "english": vocab["english"],
+                "audio_fr": next(audio_results),
+                "audio_en": next(audio_results),
             }
         )
+    return {
+        "id": pair["id"],
+        "french": pair["french"],
+        "english": pair["english"],
+        "audio_fr": french_audio,
+        "audio_en": english_audio,
+        "key_vocab": key_vocab_audio,
+    }
+
+
+async def _build_segments(
+    client: AsyncOpenAI, text: str, on_segment: Optional[Callable[[Dict[str, object]], None]] = None
+) -> List[Dict[str, object]]:
+    """Translate ``text`` and synthesize every clip; audio fields hold raw MP3 bytes.
+
+    Each sentence's audio starts as soon as the streamed translation yields it, so synthesis
+    overlaps with the model still translating the rest of the passage. ``on_segment`` is called
+    with each segment as soon as its audio is ready.
+    """
+
+    def publish(task: "asyncio.Task[Dict[str, object]]") -> None:
+        if not task.cancelled() and task.exception() is None:
+            on_segment(task.result())
+
+    tasks: List["asyncio.Task[Dict[str, object]]"] = []
+    try:
+        index = 0
+        async for pair in _stream_translated_sentences(client, text):
+            prepared_pair = _normalize_pair(pair, index)
+            index += 1
+            if prepared_pair is None:
+                app.logger.debug("Skipping: %s", pair)
+                continue
+            task = asyncio.ensure_future(_synthesize_segment(client, prepared_pair))
+            if on_segment is not None:
+                task.add_done_callback(publish)
+            tasks.append(task)
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+async def _synthesize_segment_audio(
+    client: AsyncOpenAI, french: str, english: str, key_vocab: List[Dict[str, str]]
+) -> Tuple[str, str, List[Dict[str, str]]]:
+    speech_requests = [(french, "french"), (english, "english")]
+    for vocab in key_vocab:
+        speech_requests.append((vocab["french"], "french"))
+        speech_requests.append((vocab["english"], "english"))
+    audio_results = iter(
+        await _gather_or_cancel(
+            [_synthesize_audio(client, speech_text, language) for speech_text, language in speech_requests]
+        )
+    )
 
-    return segments
+    french_audio = _encode_audio(next(audio_results))
+    english_audio = _encode_audio(next(audio_results))
+    key_vocab_audio: List[Dict[str, str]] = []
+    for vocab_index, vocab in enumerate(key_vocab):
+        key_vocab_audio.append(
+            {
+                "id": f"{vocab_index}",
+                "french": vocab["french"],
+                "english": vocab["english"],
+                "audio_fr": _encode_audio(next(audio_results)),
+                "audio_en": _encode_audio(next(audio_results)),
+            }
+        )
+    return french_audio, english_audio, key_vocab_audio
 
 
 @app.post("/api/fetch-text")
@@ -340,34 +1014,40 @@ def fetch_text():
             text = _extract_text_from_url(url)
         except requests.RequestException as error:
             return jsonify({"error": f"Failed to retrieve article: {error}"}), 502
+        except ValueError as error:
+            return jsonify({"error": str(error)}), 422
     elif source_type == "prompt":
         prompt = data.get("prompt")
         if not prompt:
             return jsonify({"error": "A prompt is required."}), 400
         try:
             client = _get_openai_client()
-            response = client.responses.create(
-                model="gpt-4o-mini",
-                input=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are an assistant that writes French passages suitable for "
-                            "language learners."
-                        ),
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    },
-                ],
+            response = _run_async(
+                _with_retries(
+                    lambda: client.responses.create(
+                        model="gpt-4o-mini",
+                        input=[
+                            {
+                                "role": "system",
+                                "content": (
+                                    "You are an assistant that writes French passages suitable for "
+                                    "language learners."
+                                ),
+                            },
+                            {
+                                "role": "user",
+                                "content": prompt,
+                            },
+                        ],
+                    )
+                )
             )
             generated_text = _extract_response_text(response)
             text = generated_text.strip()
         except Exception as error:  # noqa: BLE001
             return jsonify({"error": f"Unable to generate text: {error}"}), 500
     elif source_type == "text":
-        text = data.get("text", "").strip()
+        text = (data.get("text") or "").strip()
         if not text:
             return jsonify({"error": "Text input is empty."}), 400
     else:
@@ -382,44 +1062,20 @@ def fetch_text():
 @app.post("/api/translate-sentences")
 def translate_sentences():
     data = request.get_json(silent=True) or {}
-    text = data.get("text", "").strip()
+    text = (data.get("text") or "").strip()
 
     if not text:
         return jsonify({"error": "Text is required to translate."}), 400
 
     try:
         client = _get_openai_client()
-        sentence_pairs = _split_and_translate_sentences(client, text)
+        sentence_pairs = _run_async(_split_and_translate_sentences(client, text))
     except RuntimeError as error:
         return jsonify({"error": str(error)}), 500
     except Exception as error:  # noqa: BLE001
         return jsonify({"error": f"Unable to translate sentences: {error}"}), 500
 
-    prepared_pairs = []
-    for index, pair in enumerate(sentence_pairs):
-        french = (pair.get("french") or "").strip()
-        english = (pair.get("english") or "").strip()
-        if not french or not english:
-            continue
-        key_vocab_items: List[Dict[str, str]] = []
-        raw_key_vocab = pair.get("key_vocab")
-        if isinstance(raw_key_vocab, list):
-            for vocab in raw_key_vocab:
-                vocab_fr = (vocab.get("french") or "").strip()
-                vocab_en = (vocab.get("english") or "").strip()
-                if not vocab_fr or not vocab_en:
-                    continue
-                key_vocab_items.append({"french": vocab_fr, "english": vocab_en})
-
-        prepared_pairs.append(
-            {
-                "id": index,
-                "french": french,
-                "english": english,
-                "key_vocab": key_vocab_items,
-            }
-        )
-
+    prepared_pairs = _prepare_pairs(sentence_pairs)
     if not prepared_pairs:
         return jsonify({"error": "No sentences were detected in the provided text."}), 422
 
@@ -435,33 +1091,13 @@ def generate_segment_audio():
     if not french or not english:
         return jsonify({"error": "Both French and English sentences are required."}), 400
 
-    raw_key_vocab = data.get("key_vocab")
-    sanitized_key_vocab: List[Dict[str, str]] = []
-    if isinstance(raw_key_vocab, list):
-        for vocab in raw_key_vocab:
-            vocab_fr = (vocab.get("french") or "").strip()
-            vocab_en = (vocab.get("english") or "").strip()
-            if not vocab_fr or not vocab_en:
-                continue
-            sanitized_key_vocab.append({"french": vocab_fr, "english": vocab_en})
+    sanitized_key_vocab = _normalize_key_vocab(data.get("key_vocab"))
 
     try:
         client = _get_openai_client()
-        french_audio = _synthesize_audio(client, french, 'french')
-        english_audio = _synthesize_audio(client, english, 'english')
-        key_vocab_audio: List[Dict[str, str]] = []
-        for vocab_index, vocab in enumerate(sanitized_key_vocab):
-            vocab_fr_audio = _synthesize_audio(client, vocab["french"],'french')
-            vocab_en_audio = _synthesize_audio(client, vocab["english"],'english')
-            key_vocab_audio.append(
-                {
-                    "id": f"{vocab_index}",
-                    "french": vocab["french"],
-                    "english": vocab["english"],
-                    "audio_fr": vocab_fr_audio,
-                    "audio_en": vocab_en_audio,
-                }
-            )
+        french_audio, english_audio, key_vocab_audio = _run_async(
+            _synthesize_segment_audio(client, french, english, sanitized_key_vocab)
+        )
     except RuntimeError as error:
         return jsonify({"error": str(error)}), 500
     except Exception as error:  # noqa: BLE001
@@ -470,102 +1106,273 @@ def generate_segment_audio():
     return jsonify({"audio_fr": french_audio, "audio_en": english_audio, "key_vocab": key_vocab_audio})
 
 
+def _with_base64_audio(segments: List[Dict[str, object]]) -> List[Dict[str, object]]:
+    encoded_segments: List[Dict[str, object]] = []
+    for segment in segments:
+        encoded_segments.append(
+            {
+                **segment,
+                "audio_fr": _encode_audio(segment["audio_fr"]),
+                "audio_en": _encode_audio(segment["audio_en"]),
+                "key_vocab": [
+                    {
+                        **vocab,
+                        "audio_fr": _encode_audio(vocab["audio_fr"]),
+                        "audio_en": _encode_audio(vocab["audio_en"]),
+                    }
+                    for vocab in segment["key_vocab"]
+                ],
+            }
+        )
+    return encoded_segments
+
+
+def _iter_multipart_lesson(segments: List[Dict[str, object]], boundary: str) -> Iterator[bytes]:
+    """Yield a multipart/mixed body: JSON metadata first, then one audio/mpeg part per clip.
+
+    Audio fields in the metadata hold the Content-ID of the part carrying that clip.
+    """
+    audio_parts: List[Tuple[str, bytes]] = []
+
+    def attach(audio: Optional[bytes], content_id: str) -> Optional[str]:
+        if not audio:
+            return None
+        audio_parts.append((content_id, audio))
+        return content_id
+
+    metadata_segments: List[Dict[str, object]] = []
+    for segment in segments:
+        segment_id = segment["id"]
+        metadata_segments.append(
+            {
+                **segment,
+                "audio_fr": attach(segment["audio_fr"], f"seg-{segment_id}-fr"),
+                "audio_en": attach(segment["audio_en"], f"seg-{segment_id}-en"),
+                "key_vocab": [
+                    {
+                        **vocab,
+                        "audio_fr": attach(vocab["audio_fr"], f"vocab-{vocab['id']}-fr"),
+                        "audio_en": attach(vocab["audio_en"], f"vocab-{vocab['id']}-en"),
+                    }
+                    for vocab in segment["key_vocab"]
+                ],
+            }
+        )
+
+    delimiter = f"--{boundary}\r\n".encode("ascii")
+    yield delimiter
+    yield b"Content-Type: application/json\r\n\r\n"
+    yield orjson.dumps({"segments": metadata_segments})
+    yield b"\r\n"
+    for content_id, audio in audio_parts:
+        yield delimiter
+        yield f"Content-Type: audio/mpeg\r\nContent-ID: <{content_id}>\r\n\r\n".encode("ascii")
+        yield audio
+        yield b"\r\n"
+    yield f"--{boundary}--\r\n".encode("ascii")
+
+
+def _stream_record(item: Dict[str, object], mimetype: str) -> bytes:
+    if mimetype == "text/event-stream":
+        return b"data: " + orjson.dumps(item) + b"\n\n"
+    return orjson.dumps(item) + b"\n"
+
+
+def _iter_streamed_segments(client: AsyncOpenAI, text: str, mimetype: str) -> Iterator[bytes]:
+    """Yield each segment, with base64 audio, in the order synthesis finishes.
+
+    Translation streams on the event loop while earlier sentences are already being synthesized.
+    Records are NDJSON lines or Server-Sent Events ``data:`` frames depending on ``mimetype``;
+    a failure ends the stream with an ``{"error": ...}`` record.
+    """
+    # Segment callbacks run before the lesson future completes, so the None sentinel always comes last.
+    finished: "queue.Queue[Optional[Dict[str, object]]]" = queue.Queue()
+    future = asyncio.run_coroutine_threadsafe(_build_segments(client, text, finished.put), _get_event_loop())
+    future.add_done_callback(lambda _: finished.put(None))
+    try:
+        segment_count = 0
+        while (segment := finished.get()) is not None:
+            segment_count += 1
+            yield _stream_record(_with_base64_audio([segment])[0], mimetype)
+        error = future.exception()
+        if error is not None:
+            yield _stream_record({"error": f"Unable to generate audio: {error}"}, mimetype)
+        elif not segment_count:
+            yield _stream_record({"error": "No sentences were detected in the provided text."}, mimetype)
+    finally:
+        # Stop outstanding translation and synthesis on failure or when the client goes away.
+        future.cancel()
+
+
 @app.post("/api/generate-audio")
 def generate_audio():
     data = request.get_json(silent=True) or {}
-    text = data.get("text", "").strip()
+    text = (data.get("text") or "").strip()
 
     if not text:
         return jsonify({"error": "Text is required to generate audio."}), 400
 
+    response_type = request.accept_mimetypes.best_match(
+        ["application/json", "multipart/mixed", "application/x-ndjson", "text/event-stream"]
+    )
+    streamed = response_type in ("application/x-ndjson", "text/event-stream")
     try:
         client = _get_openai_client()
-        segments = _build_segments(client, text)
+        # Streaming clients get each segment as soon as its audio is ready rather than the whole lesson
+        # at once; once the stream has started, translation and synthesis errors are reported in-band.
+        if streamed:
+            return Response(
+                stream_with_context(_iter_streamed_segments(client, text, response_type)),
+                mimetype=response_type,
+                headers={"Cache-Control": "no-cache"},
+            )
+        segments = _run_async(_build_segments(client, text))
     except RuntimeError as error:
         return jsonify({"error": str(error)}), 500
     except Exception as error:  # noqa: BLE001
         return jsonify({"error": f"Unable to generate audio: {error}"}), 500
 
-    return jsonify({"segments": segments})
+    if not segments:
+        return jsonify({"error": "No sentences were detected in the provided text."}), 422
 
+    # Clients that ask for multipart/mixed get raw MP3 parts instead of inline base64.
+    if response_type == "multipart/mixed":
+        boundary = uuid.uuid4().hex
+        return Response(
+            stream_with_context(_iter_multipart_lesson(segments, boundary)),
+            mimetype=f"multipart/mixed; boundary={boundary}",
+        )
 
-@app.post("/api/download-lesson")
-def download_lesson_audio():
-    data = request.get_json(silent=True) or {}
-    variant = (data.get("variant") or "").strip().lower()
-    if variant not in DOWNLOAD_VARIANTS:
-        return jsonify({"error": "Unsupported download option."}), 400
+    return jsonify({"segments": _with_base64_audio(segments)})
 
-    segments_payload = data.get("segments")
-    if not isinstance(segments_payload, list) or not segments_payload:
-        return jsonify({"error": "Segments are required to build the download."}), 400
 
-    combined_audio = bytearray()
+def _payload_audio(item: Dict[str, object], key: str) -> Optional[bytes]:
+    return _decode_audio_bytes(_get_audio_value(item, key))
+
 
-    for segment in segments_payload:
+def _iter_lesson_audio(
+    segments: List[object],
+    variant: str,
+    load_audio: Callable[[Dict[str, object], str], Optional[T]],
+) -> Iterator[T]:
+    """Yield each clip of ``variant`` in playback order, as returned by ``load_audio``."""
+    include_english = variant in ("french-english", "french-english-key-vocab")
+    include_key_vocab = variant in ("french-key-vocab", "french-english-key-vocab")
+
+    for segment in segments:
         if not isinstance(segment, dict):
             continue
-        audio_fr = _decode_audio_bytes(_get_audio_value(segment, "audio_fr"))
-        audio_en = _decode_audio_bytes(_get_audio_value(segment, "audio_en"))
-
+        audio_fr = load_audio(segment, "audio_fr")
+        if audio_fr:
+            yield audio_fr
         if variant == "french-only":
-            if audio_fr:
-                combined_audio.extend(audio_fr)
             continue
 
-        if variant == "french-english":
-            if audio_fr:
-                combined_audio.extend(audio_fr)
+        if include_english:
+            audio_en = load_audio(segment, "audio_en")
             if audio_en:
-                combined_audio.extend(audio_en)
-            if audio_fr:
-                combined_audio.extend(audio_fr)
-            continue
+                yield audio_en
 
-        if variant == "french-key-vocab":
-            if audio_fr:
-                combined_audio.extend(audio_fr)
-            key_vocab_entries = _collect_key_vocab(segment)
-            for vocab in key_vocab_entries:
+        if include_key_vocab:
+            for vocab in _collect_key_vocab(segment):
                 if not isinstance(vocab, dict):
                     continue
-                vocab_fr = _decode_audio_bytes(_get_audio_value(vocab, "audio_fr"))
-                vocab_en = _decode_audio_bytes(_get_audio_value(vocab, "audio_en"))
+                vocab_fr = load_audio(vocab, "audio_fr")
+                vocab_en = load_audio(vocab, "audio_en")
                 if vocab_fr:
-                    combined_audio.extend(vocab_fr)
+                    yield vocab_fr
                 if vocab_en:
-                    combined_audio.extend(vocab_en)
+                    yield vocab_en
                 if vocab_fr:
-                    combined_audio.extend(vocab_fr)
-            if audio_fr:
-                combined_audio.extend(audio_fr)
-            continue
+                    yield vocab_fr
 
-        if variant == "french-english-key-vocab":
-            if audio_fr:
-                combined_audio.extend(audio_fr)
-            if audio_en:
-                combined_audio.extend(audio_en)
-            key_vocab_entries = _collect_key_vocab(segment)
-            for vocab in key_vocab_entries:
-                if not isinstance(vocab, dict):
+        if audio_fr:
+            yield audio_fr
+
+
+def _write_lesson_file(session_dir: str, segments: List[object], variant: str, lesson_path: str) -> bool:
+    # Build into a private temp file so concurrent first downloads never serve a partial lesson.
+    temp_path = f"{lesson_path}.{uuid.uuid4().hex}.tmp"
+    wrote_audio = False
+    try:
+        with open(temp_path, "wb") as lesson_file:
+            clip_paths = _iter_lesson_audio(
+                segments, variant, lambda item, key: _session_audio_path(session_dir, item.get(f"{key}_file"))
+            )
+            for clip_path in clip_paths:
+                try:
+                    with open(clip_path, "rb") as clip_file:
+                        shutil.copyfileobj(clip_file, lesson_file)
+                except FileNotFoundError:
                     continue
-                vocab_fr = _decode_audio_bytes(_get_audio_value(vocab, "audio_fr"))
-                vocab_en = _decode_audio_bytes(_get_audio_value(vocab, "audio_en"))
-                if vocab_fr:
-                    combined_audio.extend(vocab_fr)
-                if vocab_en:
-                    combined_audio.extend(vocab_en)
-                if vocab_fr:
-                    combined_audio.extend(vocab_fr)
-            if audio_fr:
-                combined_audio.extend(audio_fr)
+                wrote_audio = True
+        if wrote_audio:
+            os.replace(temp_path, lesson_path)
+    finally:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+    return wrote_audio
+
+
+def _download_saved_lesson(session_id: int, variant: str):
+    """Serve a saved lesson variant, concatenating it once and reusing the file afterwards."""
+    session_dir = os.path.join(_ensure_sessions_dir(), str(session_id))
+    lesson_filename = f"lesson_{variant}.mp3"
+    lesson_path = os.path.join(session_dir, lesson_filename)
+
+    if not os.path.isfile(lesson_path):
+        manifest_path = os.path.join(session_dir, "manifest.json")
+        try:
+            manifest = _read_manifest(manifest_path)
+            segments = manifest.get("segments")
+            if not isinstance(segments, list) or not _write_lesson_file(session_dir, segments, variant, lesson_path):
+                return jsonify({"error": "Unable to assemble audio with the provided data."}), 422
+        except FileNotFoundError:
+            return jsonify({"error": "Session not found."}), 404
+        except Exception as error:  # noqa: BLE001
+            current_app.logger.exception("Failed to build lesson download")
+            return jsonify({"error": f"Unable to build download: {error}"}), 500
+
+    return send_from_directory(
+        session_dir,
+        lesson_filename,
+        mimetype="audio/mpeg",
+        as_attachment=True,
+        download_name=f"lesson-{variant}.mp3",
+        conditional=True,
+    )
+
+
+@app.post("/api/download-lesson")
+def download_lesson_audio():
+    data = request.get_json(silent=True) or {}
+    variant = (data.get("variant") or "").strip().lower()
+    if variant not in DOWNLOAD_VARIANTS:
+        return jsonify({"error": "Unsupported download option."}), 400
+
+    session_id = data.get("session_id")
+    if session_id is not None:
+        if not str(session_id).isdigit():
+            return jsonify({"error": "Invalid session id."}), 400
+        return _download_saved_lesson(int(session_id), variant)
+
+    segments_payload = data.get("segments")
+    if not isinstance(segments_payload, list) or not segments_payload:
+        return jsonify({"error": "Segments are required to build the download."}), 400
 
-    if not combined_audio:
+    # Pull the first chunk up front so an empty lesson can still return a JSON error.
+    audio_chunks = _iter_lesson_audio(segments_payload, variant, _payload_audio)
+    first_chunk = next(audio_chunks, None)
+    if first_chunk is None:
         return jsonify({"error": "Unable to assemble audio with the provided data."}), 422
 
-    audio_base64 = base64.b64encode(bytes(combined_audio)).decode("utf-8")
-    return jsonify({"audio_base64": audio_base64, "variant": variant})
+    return Response(
+        stream_with_context(itertools.chain([first_chunk], audio_chunks)),
+        mimetype="audio/mpeg",
+        headers={"Content-Disposition": f'attachment; filename="lesson-{variant}.mp3"'},
+    )
 
 
 @app.post("/api/save-session")
@@ -585,23 +1392,28 @@ def save_session():
         return jsonify({"error": f"Unable to prepare storage: {error}"}), 500
 
     manifest_segments: List[Dict[str, object]] = []
+    # Audio files are written in parallel; each manifest field is filled in once its write finishes.
+    pending_writes: List[Tuple[Dict[str, object], str, "Future[Optional[str]]"]] = []
+
+    def queue_audio_write(entry: Dict[str, object], field: str, filename: str, audio_base64: Optional[str]) -> None:
+        future = _file_io_pool.submit(_write_audio_file, session_dir, filename, audio_base64)
+        pending_writes.append((entry, field, future))
 
     try:
         for index, segment in enumerate(segments):
             french = (segment.get("french") or "").strip()
             english = (segment.get("english") or "").strip()
 
-            audio_fr_file = _write_audio_file(session_dir, f"segment_{index:03d}_fr.mp3", segment.get("audio_fr"))
-            audio_en_file = _write_audio_file(session_dir, f"segment_{index:03d}_en.mp3", segment.get("audio_en"))
-
             manifest_segment: Dict[str, object] = {
                 "id": segment.get("id", index),
                 "french": french,
                 "english": english,
-                "audio_fr_file": audio_fr_file,
-                "audio_en_file": audio_en_file,
+                "audio_fr_file": None,
+                "audio_en_file": None,
                 "key_vocab": [],
             }
+            queue_audio_write(manifest_segment, "audio_fr_file", f"segment_{index:03d}_fr.mp3", segment.get("audio_fr"))
+            queue_audio_write(manifest_segment, "audio_en_file", f"segment_{index:03d}_en.mp3", segment.get("audio_en"))
 
             raw_key_vocab = segment.get("key_vocab") or segment.get("keyVocab") or []
             key_vocab_entries: List[Dict[str, object]] = []
@@ -609,67 +1421,69 @@ def save_session():
                 for vocab_index, vocab in enumerate(raw_key_vocab):
                     vocab_french = (vocab.get("french") or "").strip()
                     vocab_english = (vocab.get("english") or "").strip()
-                    audio_fr_filename = _write_audio_file(
-                        session_dir,
+                    vocab_entry: Dict[str, object] = {
+                        "id": vocab.get("id", f"{index}-{vocab_index}"),
+                        "french": vocab_french,
+                        "english": vocab_english,
+                        "audio_fr_file": None,
+                        "audio_en_file": None,
+                    }
+                    queue_audio_write(
+                        vocab_entry,
+                        "audio_fr_file",
                         f"segment_{index:03d}_kv_{vocab_index:03d}_fr.mp3",
                         vocab.get("audio_fr"),
                     )
-                    audio_en_filename = _write_audio_file(
-                        session_dir,
+                    queue_audio_write(
+                        vocab_entry,
+                        "audio_en_file",
                         f"segment_{index:03d}_kv_{vocab_index:03d}_en.mp3",
                         vocab.get("audio_en"),
                     )
-                    key_vocab_entries.append(
-                        {
-                            "id": vocab.get("id", f"{index}-{vocab_index}"),
-                            "french": vocab_french,
-                            "english": vocab_english,
-                            "audio_fr_file": audio_fr_filename,
-                            "audio_en_file": audio_en_filename,
-                        }
-                    )
+                    key_vocab_entries.append(vocab_entry)
             manifest_segment["key_vocab"] = key_vocab_entries
             manifest_segments.append(manifest_segment)
 
+        wait([future for _, _, future in pending_writes])
+        for entry, field, future in pending_writes:
+            entry[field] = future.result()
+
         manifest = {
             "title": title or f"Lesson {session_id}",
             "raw_text": raw_text,
             "segments": manifest_segments,
         }
         manifest_path = os.path.join(session_dir, "manifest.json")
-        with open(manifest_path, "w", encoding="utf-8") as manifest_file:
-            json.dump(manifest, manifest_file, ensure_ascii=False, indent=2)
+        _write_manifest(manifest_path, manifest)
+        _invalidate_session_list()
     except Exception as error:  # noqa: BLE001
         current_app.logger.exception("Failed to save session")
+        wait([future for _, _, future in pending_writes])
         shutil.rmtree(session_dir, ignore_errors=True)
         return jsonify({"error": f"Unable to save session: {error}"}), 500
 
     return jsonify({"id": session_id, "title": manifest["title"]})
 
 
-@app.get("/api/sessions")
-def list_sessions():
-    sessions_dir = _ensure_sessions_dir()
-    sessions: List[Dict[str, object]] = []
-
-    try:
-        names = [name for name in os.listdir(sessions_dir) if name.isdigit()]
-    except FileNotFoundError:
-        names = []
+def _read_session_summaries(sessions_dir: str) -> List[Dict[str, object]]:
+    with os.scandir(sessions_dir) as entries:
+        session_entries = [entry for entry in entries if entry.name.isdigit() and entry.is_dir()]
 
-    for name in sorted(names, key=int, reverse=True):
-        manifest_path = os.path.join(sessions_dir, name, "manifest.json")
-        if not os.path.isfile(manifest_path):
-            continue
+    sessions: List[Dict[str, object]] = []
+    for entry in sorted(session_entries, key=lambda entry: int(entry.name), reverse=True):
+        name = entry.name
+        manifest_path = os.path.join(entry.path, "manifest.json")
         try:
-            with open(manifest_path, "r", encoding="utf-8") as manifest_file:
-                manifest = json.load(manifest_file)
+            manifest = _read_manifest(manifest_path)
+        except FileNotFoundError:
+            continue
         except Exception as error:  # noqa: BLE001
             current_app.logger.error("Failed to read manifest for %s: %s", name, error)
             continue
 
         raw_text = (manifest.get("raw_text") or "").strip()
-        preview = re.sub(r"\s+", " ", raw_text.replace("\n", " ")).strip()
+        # Only the start of the text can reach the 160-character preview.
+        preview = _WHITESPACE_RE.sub(" ", raw_text[:PREVIEW_SOURCE_CHARS]).strip()
         sessions.append(
             {
                 "id": int(name),
@@ -678,7 +1492,22 @@ def list_sessions():
                 "preview": preview[:160],
             }
         )
+    return sessions
+
 
+@app.get("/api/sessions")
+def list_sessions():
+    global _session_list_cache
+    sessions_dir = _ensure_sessions_dir()
+
+    # Reuse the last listing until the sessions directory or the shared change marker moves on.
+    list_version = _session_list_version(sessions_dir)
+    cached_listing = _session_list_cache
+    if cached_listing is not None and cached_listing[0] == list_version:
+        return jsonify({"sessions": cached_listing[1]})
+
+    sessions = _read_session_summaries(sessions_dir)
+    _session_list_cache = (list_version, sessions)
     return jsonify({"sessions": sessions})
 
 
@@ -688,12 +1517,10 @@ def load_session(session_id: int):
     session_dir = os.path.join(sessions_dir, str(session_id))
     manifest_path = os.path.join(session_dir, "manifest.json")
 
-    if not os.path.isfile(manifest_path):
-        return jsonify({"error": "Session not found."}), 404
-
     try:
-        with open(manifest_path, "r", encoding="utf-8") as manifest_file:
-            manifest = json.load(manifest_file)
+        manifest = _read_manifest(manifest_path)
+    except FileNotFoundError:
+        return jsonify({"error": "Session not found."}), 404
     except Exception as error:  # noqa: BLE001
         current_app.logger.exception("Failed to read session manifest")
         return jsonify({"error": f"Unable to read session: {error}"}), 500
@@ -711,8 +1538,8 @@ def load_session(session_id: int):
                             "id": vocab.get("id"),
                             "french": (vocab.get("french") or "").strip(),
                             "english": (vocab.get("english") or "").strip(),
-                            "audio_fr": _read_audio_file_as_base64(session_dir, vocab.get("audio_fr_file")),
-                            "audio_en": _read_audio_file_as_base64(session_dir, vocab.get("audio_en_file")),
+                            "audio_fr_url": _session_audio_url(session_id, vocab.get("audio_fr_file")),
+                            "audio_en_url": _session_audio_url(session_id, vocab.get("audio_en_file")),
                         }
                     )
 
@@ -721,8 +1548,8 @@ def load_session(session_id: int):
                     "id": segment.get("id", index),
                     "french": (segment.get("french") or "").strip(),
                     "english": (segment.get("english") or "").strip(),
-                    "audio_fr": _read_audio_file_as_base64(session_dir, segment.get("audio_fr_file")),
-                    "audio_en": _read_audio_file_as_base64(session_dir, segment.get("audio_en_file")),
+                    "audio_fr_url": _session_audio_url(session_id, segment.get("audio_fr_file")),
+                    "audio_en_url": _session_audio_url(session_id, segment.get("audio_en_file")),
                     "key_vocab": key_vocab_items,
                 }
             )
@@ -736,6 +1563,15 @@ def load_session(session_id: int):
     )
 
 
+@app.get("/api/sessions/<int:session_id>/audio/<filename>")
+def session_audio(session_id: int, filename: str):
+    # Only saved clips are served; the manifest, cached lesson files and partial writes share the directory.
+    if not _SEGMENT_AUDIO_RE.fullmatch(filename):
+        return jsonify({"error": "Audio file not found."}), 404
+    session_dir = os.path.join(_ensure_sessions_dir(), str(session_id))
+    return send_from_directory(session_dir, filename, mimetype="audio/mpeg", conditional=True)
+
+
 @app.patch("/api/sessions/<int:session_id>")
 def update_session(session_id: int):
     data = request.get_json(silent=True) or {}
@@ -747,15 +1583,13 @@ def update_session(session_id: int):
     session_dir = os.path.join(sessions_dir, str(session_id))
     manifest_path = os.path.join(session_dir, "manifest.json")
 
-    if not os.path.isfile(manifest_path):
-        return jsonify({"error": "Session not found."}), 404
-
     try:
-        with open(manifest_path, "r", encoding="utf-8") as manifest_file:
-            manifest = json.load(manifest_file)
+        manifest = _read_manifest(manifest_path)
         manifest["title"] = title
-        with open(manifest_path, "w", encoding="utf-8") as manifest_file:
-            json.dump(manifest, manifest_file, ensure_ascii=False, indent=2)
+        _write_manifest(manifest_path, manifest)
+        _invalidate_session_list()
+    except FileNotFoundError:
+        return jsonify({"error": "Session not found."}), 404
     except Exception as error:  # noqa: BLE001
         current_app.logger.exception("Failed to update session title")
         return jsonify({"error": f"Unable to update session: {error}"}), 500
@@ -773,6 +1607,7 @@ def delete_session(session_id: int):
 
     try:
         shutil.rmtree(session_dir)
+        _invalidate_session_list()
     except Exception as error:  # noqa: BLE001
         current_app.logger.exception("Failed to delete session directory")
         return jsonify({"error": f"Unable to delete session: {error}"}), 500
@@ -786,4 +1621,5 @@ def health_check():
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=3030, debug=True)
+    # The reloader and debugger are opt-in; the dev server handles each request on its own thread.
+    app.run(host="0.0.0.0", port=3030, debug=os.getenv("FLASK_DEBUG") == "1", threaded=True)
@@ -12,6 +12,7 @@ const SOURCE_TYPES = [
 const SENTENCE_STUDY_SEQUENCE = ['audioFrUrl', 'audioEnUrl', 'audioFrUrl']
 const KEY_VOCAB_SEQUENCE = ['audioFrUrl', 'audioEnUrl', 'audioFrUrl']
 const STUDY_DELAY_MS = 250
+const SEGMENT_AUDIO_CONCURRENCY = 4
 const DOWNLOAD_OPTIONS = [
   {
     id: 'french-only',
@@ -61,6 +62,10 @@ function createAudioUrlFromBase64(base64String) {
   }
 }
 
+function resolveApiUrl(path) {
+  return path ? `${API_BASE_URL}${path}` : null
+}
+
 function App() {
   const [sourceType, setSourceType] = useState('url')
   const [urlInput, setUrlInput] = useState('')
@@ -72,6 +77,7 @@ function App() {
   const [draftText, setDraftText] = useState('')
   const [confirmedText, setConfirmedText] = useState('')
   const [segments, setSegments] = useState([])
+  const [currentSessionId, setCurrentSessionId] = useState(null)
   const [currentSentenceIndex, setCurrentSentenceIndex] = useState(0)
   const [isPlaying, setIsPlaying] = useState(false)
   const [error, setError] = useState('')
@@ -247,23 +253,22 @@ function App() {
       const response = await fetch(`${API_BASE_URL}/api/download-lesson`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          variant: selectedDownloadVariant,
-          segments: payloadSegments
-        })
+        // Saved lessons are assembled server-side from their stored MP3 files.
+        body: JSON.stringify(
+          currentSessionId != null
+            ? { variant: selectedDownloadVariant, session_id: currentSessionId }
+            : { variant: selectedDownloadVariant, segments: payloadSegments }
+        )
       })
-      const data = await response.json().catch(() => ({}))
       if (!response.ok) {
+        const data = await response.json().catch(() => ({}))
         throw new Error(data.error || 'Unable to prepare download.')
       }
-      const audioBase64 = data.audio_base64 || data.audioBase64
-      if (!audioBase64) {
+      const audioBlob = await response.blob()
+      if (!audioBlob.size) {
         throw new Error('Audio track missing from download response.')
       }
-      const downloadUrl = createAudioUrlFromBase64(audioBase64)
-      if (!downloadUrl) {
-        throw new Error('Unable to prepare MP3 download.')
-      }
+      const downloadUrl = URL.createObjectURL(audioBlob)
 
       const tempLink = document.createElement('a')
       tempLink.href = downloadUrl
@@ -282,7 +287,7 @@ function App() {
     } finally {
       setIsPreparingDownload(false)
     }
-  }, [segments, selectedDownloadVariant])
+  }, [currentSessionId, segments, selectedDownloadVariant])
 
   const attachAudio = useCallback((url, mode, onEnded) => {
     if (!url) {
@@ -584,6 +589,7 @@ function App() {
       setDraftText('')
       setConfirmedText('')
       setSegments([])
+      setCurrentSessionId(null)
       setCurrentSentenceIndex(0)
       setError('')
       setViewMode('setup')
@@ -631,6 +637,7 @@ function App() {
     if (segments.length) {
       revokePreviousUrls()
       setSegments([])
+      setCurrentSessionId(null)
       setCurrentSentenceIndex(0)
       setViewMode('setup')
       resetPlayback()
@@ -662,16 +669,8 @@ function App() {
         revokePreviousUrls()
 
         const preparedSegments = rawSegments.map((segment, index) => {
-          const audioFr = segment?.audio_fr || null
-          const audioEn = segment?.audio_en || null
-          const audioFrUrl = createAudioUrlFromBase64(audioFr)
-          const audioEnUrl = createAudioUrlFromBase64(audioEn)
-          if (audioFrUrl) {
-            previousObjectUrlsRef.current.push(audioFrUrl)
-          }
-          if (audioEnUrl) {
-            previousObjectUrlsRef.current.push(audioEnUrl)
-          }
+          const audioFrUrl = resolveApiUrl(segment?.audio_fr_url)
+          const audioEnUrl = resolveApiUrl(segment?.audio_en_url)
 
           const rawKeyVocab = Array.isArray(segment?.key_vocab)
             ? segment.key_vocab
@@ -681,16 +680,8 @@ function App() {
 
           const preparedKeyVocab = rawKeyVocab
             .map((item, vocabIndex) => {
-              const vocabAudioFr = item?.audio_fr || null
-              const vocabAudioEn = item?.audio_en || null
-              const vocabAudioFrUrl = createAudioUrlFromBase64(vocabAudioFr)
-              const vocabAudioEnUrl = createAudioUrlFromBase64(vocabAudioEn)
-              if (vocabAudioFrUrl) {
-                previousObjectUrlsRef.current.push(vocabAudioFrUrl)
-              }
-              if (vocabAudioEnUrl) {
-                previousObjectUrlsRef.current.push(vocabAudioEnUrl)
-              }
+              const vocabAudioFrUrl = resolveApiUrl(item?.audio_fr_url)
+              const vocabAudioEnUrl = resolveApiUrl(item?.audio_en_url)
 
               const french = (item?.french || '').trim()
               const english = (item?.english || '').trim()
@@ -702,8 +693,8 @@ function App() {
                 id: item?.id ?? `${segment?.id ?? index}-${vocabIndex}`,
                 french,
                 english,
-                audio_fr: vocabAudioFr,
-                audio_en: vocabAudioEn,
+                audio_fr: null,
+                audio_en: null,
                 audioFrUrl: vocabAudioFrUrl,
                 audioEnUrl: vocabAudioEnUrl
               }
@@ -714,8 +705,8 @@ function App() {
             id: segment?.id ?? index,
             french: (segment?.french || '').trim(),
             english: (segment?.english || '').trim(),
-            audio_fr: audioFr,
-            audio_en: audioEn,
+            audio_fr: null,
+            audio_en: null,
             audioFrUrl,
             audioEnUrl,
             keyVocab: preparedKeyVocab
@@ -725,11 +716,13 @@ function App() {
         setDraftText(rawText)
         setConfirmedText(rawText)
         setSegments(preparedSegments)
+        setCurrentSessionId(sessionId)
         setCurrentSentenceIndex(0)
         setViewMode('study')
       } catch (loadError) {
         console.error(loadError)
         setSegments([])
+        setCurrentSessionId(null)
         setCurrentSentenceIndex(0)
         setViewMode('setup')
         setError(loadError instanceof Error ? loadError.message : 'Unable to load the selected session.')
@@ -855,6 +848,7 @@ function App() {
     }
 
     setIsGeneratingAudio(true)
+    setCurrentSessionId(null)
     setGenerationStage('translating')
     setGenerationProgress({ current: 0, total: 0 })
     setError('')
@@ -895,18 +889,17 @@ function App() {
       revokePreviousUrls()
       if (!sanitizedPairs.length) {
         setSegments([])
+        setCurrentSessionId(null)
         setCurrentSentenceIndex(0)
         setError('No sentences were detected in the provided text.')
         return
       }
 
-      const preparedSegments = []
+      const preparedSegments = new Array(sanitizedPairs.length)
       setGenerationStage('generating')
       setGenerationProgress({ current: 0, total: sanitizedPairs.length })
 
-      for (let index = 0; index < sanitizedPairs.length; index += 1) {
-        setGenerationProgress({ current: index, total: sanitizedPairs.length })
-        const pair = sanitizedPairs[index]
+      const generateSegment = async (pair) => {
         const audioResponse = await fetch(`${API_BASE_URL}/api/generate-segment-audio`, {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
@@ -979,7 +972,7 @@ function App() {
           })
         }
 
-        preparedSegments.push({
+        return {
           id: pair.id,
           french: pair.french,
           english: pair.english,
@@ -988,9 +981,31 @@ function App() {
           audioFrUrl,
           audioEnUrl,
           keyVocab
-        })
+        }
       }
 
+      // Keep a few segment requests in flight; the backend bounds TTS concurrency overall.
+      let nextPairIndex = 0
+      let completedCount = 0
+      let generationFailed = false
+      const runSegmentWorker = async () => {
+        while (!generationFailed && nextPairIndex < sanitizedPairs.length) {
+          const index = nextPairIndex
+          nextPairIndex += 1
+          try {
+            preparedSegments[index] = await generateSegment(sanitizedPairs[index])
+          } catch (segmentError) {
+            generationFailed = true
+            throw segmentError
+          }
+          completedCount += 1
+          setGenerationProgress({ current: completedCount, total: sanitizedPairs.length })
+        }
+      }
+      await Promise.all(
+        Array.from({ length: Math.min(SEGMENT_AUDIO_CONCURRENCY, sanitizedPairs.length) }, runSegmentWorker)
+      )
+
       const sessionPayload = {
         rawText: textToUse,
         segments: preparedSegments.map((segment) => ({
@@ -1021,6 +1036,7 @@ function App() {
         if (!saveResponse.ok) {
           throw new Error(saveData.error || 'Automatic save failed.')
         }
+        setCurrentSessionId(saveData.id ?? null)
       } catch (saveError) {
         console.error(saveError)
         const message = saveError instanceof Error ? saveError.message : 'Automatic save failed.'
@@ -1035,6 +1051,7 @@ function App() {
       setError(generationError.message)
       revokePreviousUrls()
       setSegments([])
+      setCurrentSessionId(null)
       setCurrentSentenceIndex(0)
       setViewMode('setup')
     } finally {